@@ -0,0 +1,67 @@
+"""
+Compiled kernels for the Shift Builder program.
+
+This module requires numba and NumPy. shift_builder imports it lazily on the
+first assign_shifts call and keeps to its pure Python code paths if the import
+fails. Kernels are compiled for explicit signatures and cached on disk, so only
+the first run after installation pays the compile cost.
+"""
+
+from array import array
+from typing import List, Optional
+
+import numpy as np
+from numba import njit
+
+_JIT_OPTIONS = dict(cache=True, boundscheck=False, fastmath=False)
+
+
+@njit('int32[:](boolean[:, :], int32[:], int32[:], int32[:, :], int64)', **_JIT_OPTIONS)
+def greedy_assign(eligible, shift_day, order, loads, limit):
+    """Greedy assignment over a (shifts, employees) boolean matrix.
+    
+    Shifts are visited in order and given the eligible employee with the fewest
+    shifts that day, skipping employees already at limit. Returns the employee
+    index chosen for each shift, or -1.
+    """
+    assignment = np.full(eligible.shape[0], -1, np.int32)
+    for row in order:
+        day = shift_day[row]
+        best = -1
+        for e in range(eligible.shape[1]):
+            if eligible[row, e] and loads[e, day] < limit:
+                if best == -1 or loads[e, day] < loads[best, day]:
+                    best = e
+        if best != -1:
+            assignment[row] = best
+            loads[best, day] += 1
+    return assignment
+
+
+def eligibility_matrix(eligible: List[int], n_employees: int) -> np.ndarray:
+    """Unpack per-shift employee bitsets into a (shifts, employees) boolean matrix."""
+    n_bytes = (n_employees + 7) // 8
+    packed = b''.join(bits.to_bytes(n_bytes, 'little') for bits in eligible)
+    return np.unpackbits(
+        np.frombuffer(packed, np.uint8).reshape(len(eligible), n_bytes),
+        axis=1, bitorder='little'
+    )[:, :n_employees].astype(np.bool_)
+
+
+def assign_from_bitsets(eligible: List[int], shift_day: array, order: List[int],
+                        loads: List[int], max_shifts_per_day: Optional[int]) -> List[int]:
+    """Run greedy_assign on eligibility bitsets; returns the employee index per row.
+    
+    loads holds each employee's existing shift count per day, flattened as
+    employee * 7 + day.
+    """
+    n_employees = len(loads) // 7
+    limit = np.iinfo(np.int32).max if max_shifts_per_day is None else max_shifts_per_day
+    assignment = greedy_assign(
+        eligibility_matrix(eligible, n_employees),
+        np.frombuffer(shift_day, np.int8).astype(np.int32),
+        np.array(order, np.int32),
+        np.array(loads, np.int32).reshape(n_employees, 7),
+        limit
+    )
+    return assignment.tolist()
@@ -3,13 +3,22 @@
 Example usage of the Shift Builder program with employee data loaded from JSON.
 """
 
+import sys
+
 from shift_builder import ShiftBuilder, load_employees_from_json
 
 
+def write_lines(lines):
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def main():
-    print("="*80)
-    print("SHIFT BUILDER - Loading employees from JSON file")
-    print("="*80 + "\n")
+    write_lines([
+        "="*80,
+        "SHIFT BUILDER - Loading employees from JSON file",
+        "="*80 + "\n",
+    ])
     
     # Create shift builder
     builder = ShiftBuilder()
@@ -20,12 +29,13 @@ def main():
     # Load employees from JSON file
     try:
         employees = load_employees_from_json('employees_input.json')
-        print(f"Loaded {len(employees)} employees:\n")
+        lines = [f"Loaded {len(employees)} employees:\n"]
         
         for emp in employees:
-            print(f"  - {emp.name} ({emp.employee_id})")
-            print(f"    Departments: {', '.join(emp.departments)}")
-            print(f"    Available days: {len(emp.availability)} days")
+            lines.append(f"  - {emp.name} ({emp.employee_id})")
+            lines.append(f"    Departments: {', '.join(emp.departments)}")
+            lines.append(f"    Available days: {len(emp.availability)} days")
+        write_lines(lines)
         
         # Add employees to builder
         for emp in employees:
@@ -39,9 +49,11 @@ def main():
         print(f"Error loading employees: {e}")
         return
     
-    print("\n" + "="*80)
-    print("GENERATING SHIFTS")
-    print("="*80 + "\n")
+    write_lines([
+        "\n" + "="*80,
+        "GENERATING SHIFTS",
+        "="*80 + "\n",
+    ])
     
     # Define departments that need coverage
     departments = ["Sales", "Customer Service", "Inventory"]
@@ -62,20 +74,23 @@ def main():
     
     # Show statistics
     total_shifts = len(builder.shifts)
-    assigned_shifts = len([s for s in builder.shifts if s.is_assigned()])
+    assigned_shifts = builder.assigned_mask().count(1)
     unassigned_shifts = total_shifts - assigned_shifts
     
-    print("\n" + "="*80)
-    print("STATISTICS")
-    print("="*80)
-    print(f"Total shifts: {total_shifts}")
-    print(f"Assigned shifts: {assigned_shifts}")
-    print(f"Unassigned shifts: {unassigned_shifts}")
+    lines = [
+        "\n" + "="*80,
+        "STATISTICS",
+        "="*80,
+        f"Total shifts: {total_shifts}",
+        f"Assigned shifts: {assigned_shifts}",
+        f"Unassigned shifts: {unassigned_shifts}",
+    ]
     if total_shifts > 0:
-        print(f"Assignment rate: {(assigned_shifts/total_shifts*100):.1f}%")
+        lines.append(f"Assignment rate: {(assigned_shifts/total_shifts*100):.1f}%")
     else:
-        print("Assignment rate: N/A (no shifts generated)")
-    print("="*80 + "\n")
+        lines.append("Assignment rate: N/A (no shifts generated)")
+    lines.append("="*80 + "\n")
+    write_lines(lines)
     
     # Export to JSON
     builder.export_to_json('schedule_output.json')
@@ -4,8 +4,78 @@ Shift Builder Program
 A program to automate shift building by assigning employees to shifts based on their availability and department capabilities.
 """
 
-from typing import List, Dict, Set
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, compress
+from types import MappingProxyType
+from typing import FrozenSet, Iterator, List, Dict, Mapping, Optional, Set, Tuple
 import json
+import os
+import sys
+import threading
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large inputs are parsed with json
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; export_to_json falls back to json
+    orjson = None
+
+# Compiled kernels from _shift_kernels, imported by _load_kernels on first use;
+# False once the import has failed (numba is optional)
+_kernels = None
+
+# Minimum employees x open shifts for which the compiled greedy is used. Below
+# this, importing numba and loading the cached kernel (about half a second)
+# costs more than the pure Python loop saves.
+_KERNEL_MIN_CELLS = 5000000
+
+
+# Input files at least this large are parsed incrementally when ijson is available
+_STREAMING_THRESHOLD = 1024 * 1024
+
+
+class _Interner:
+    """Maps names to small consecutive integers and back."""
+    
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self._lock = threading.Lock()
+    
+    def intern(self, name: str) -> int:
+        """Return the index of name, registering it if new."""
+        idx = self.ids.get(name)
+        if idx is None:
+            # Files may be loaded from several threads at once
+            with self._lock:
+                idx = self.ids.get(name)
+                if idx is None:
+                    self.names.append(name)
+                    idx = self.ids[name] = len(self.names) - 1
+        return idx
+
+
+# Byte translation table swapping 0 and 1, used to invert assignment flags
+_INVERT_FLAGS = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+# Time slot and department names are interned to small integers shared by every
+# Employee and ShiftBuilder, so that availability can be stored as a single
+# bitmask and departments compared as integers.
+_slots = _Interner()
+_departments = _Interner()
+
+
+def _iter_bits(mask: int):
+    """Yield the positions of the set bits in mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
 
 
 class Employee:
@@ -14,28 +84,69 @@ class Employee:
     def __init__(self, name: str, employee_id: str):
         self.name = name
         self.employee_id = employee_id
-        self.departments: Set[str] = set()
-        # Availability stored as {day: [time_slots]} where day is 0-6 (Monday-Sunday)
-        self.availability: Dict[int, List[str]] = {}
+        # Departments stored as a bitmask where bit dept_id is set for each
+        # interned department the employee can work in
+        self.dept_mask = 0
+        # Availability stored as a bitmask where bit (slot_id * 7 + day) is set
+        # when the employee can work that time slot; day is 0-6 (Monday-Sunday)
+        self.avail_mask = 0
+        # Set availability bits in the order they were added, so availability
+        # does not depend on the interned slot ids
+        self._avail_bits: List[int] = []
     
     def add_department(self, department: str):
         """Add a department that this employee can work in."""
-        self.departments.add(department)
+        self.dept_mask |= 1 << _departments.intern(department)
     
     def add_availability(self, day: int, time_slot: str):
         """Add availability for a specific day and time slot."""
-        if day not in self.availability:
-            self.availability[day] = []
-        if time_slot not in self.availability[day]:
-            self.availability[day].append(time_slot)
+        self.set_availability(day, _slots.intern(time_slot))
+    
+    def set_availability(self, day: int, slot_idx: int):
+        """Add availability for a specific day and interned time slot index."""
+        if not 0 <= day < 7:
+            raise ValueError(f"Day must be between 0 and 6, got {day}")
+        bit = slot_idx * 7 + day
+        if not (self.avail_mask >> bit) & 1:
+            self.avail_mask |= 1 << bit
+            self._avail_bits.append(bit)
     
     def is_available(self, day: int, time_slot: str) -> bool:
         """Check if employee is available on a specific day and time."""
-        return day in self.availability and time_slot in self.availability[day]
+        slot_idx = _slots.ids.get(time_slot)
+        if slot_idx is None or not 0 <= day < 7:
+            return False
+        return bool((self.avail_mask >> (slot_idx * 7 + day)) & 1)
+    
+    @property
+    def availability(self) -> Mapping[int, Tuple[str, ...]]:
+        """Read-only view of availability as {day: (time_slots)}.
+        
+        Days and time slots are listed in the order they were added. Rebuilt on
+        each access; use add_availability to change it.
+        """
+        availability: Dict[int, List[str]] = {}
+        for bit in self._avail_bits:
+            slot_idx, day = divmod(bit, 7)
+            availability.setdefault(day, []).append(_slots.names[slot_idx])
+        return MappingProxyType({
+            day: tuple(time_slots) for day, time_slots in availability.items()
+        })
+    
+    @property
+    def departments(self) -> FrozenSet[str]:
+        """Names of the departments this employee can work in.
+        
+        Read-only; use add_department to change it.
+        """
+        return frozenset(_departments.names[dept_id] for dept_id in _iter_bits(self.dept_mask))
     
     def can_work_in_department(self, department: str) -> bool:
         """Check if employee can work in a specific department."""
-        return department in self.departments
+        dept_id = _departments.ids.get(department)
+        if dept_id is None:
+            return False
+        return bool((self.dept_mask >> dept_id) & 1)
     
     def to_dict(self) -> dict:
         """Convert employee to dictionary format."""
@@ -43,18 +154,145 @@ class Employee:
             'name': self.name,
             'employee_id': self.employee_id,
             'departments': list(self.departments),
-            'availability': {str(k): v for k, v in self.availability.items()}
+            'availability': {str(k): list(v) for k, v in self.availability.items()}
         }
 
 
+class _ShiftTable:
+    """Column storage for shifts: one array per field, indexed by shift row."""
+    
+    def __init__(self, time_slots: List[str], departments: List[str]):
+        # Time slots and departments are stored as indices into these lists,
+        # which map in turn to the interned ids used by Employee
+        self.time_slots = time_slots
+        self.departments = departments
+        self.slot_ids = [_slots.intern(time_slot) for time_slot in time_slots]
+        self.dept_ids = [_departments.intern(department) for department in departments]
+        self.day = array('b')
+        self.slot_idx = array('h')
+        self.dept_idx = array('h')
+        self.employee: List[Optional[Employee]] = []
+        # 1 where the row has an employee, kept in step with the employee column
+        self.assigned = bytearray()
+        # True for the one-row table of a Shift created on its own, which a
+        # ShiftBuilder may take over; other tables belong to a schedule
+        self.private = False
+    
+    def __len__(self) -> int:
+        return len(self.day)
+    
+    def append(self, day: int, slot_idx: int, dept_idx: int, employee: Employee = None):
+        """Add a shift row to the table."""
+        self.day.append(day)
+        self.slot_idx.append(slot_idx)
+        self.dept_idx.append(dept_idx)
+        self.employee.append(employee)
+        self.assigned.append(employee is not None)
+    
+    def slot_index(self, time_slot: str) -> int:
+        """Index of time_slot in this table, adding it if it is not present."""
+        try:
+            return self.time_slots.index(time_slot)
+        except ValueError:
+            self.time_slots.append(time_slot)
+            self.slot_ids.append(_slots.intern(time_slot))
+            return len(self.time_slots) - 1
+    
+    def dept_index(self, department: str) -> int:
+        """Index of department in this table, adding it if it is not present."""
+        try:
+            return self.departments.index(department)
+        except ValueError:
+            self.departments.append(department)
+            self.dept_ids.append(_departments.intern(department))
+            return len(self.departments) - 1
+    
+    @classmethod
+    def product(cls, days: List[int], time_slots: List[str],
+                departments: List[str]) -> '_ShiftTable':
+        """Build an unassigned table with one row per (day, time slot, department).
+        
+        Rows are ordered day-major, then by time slot, then by department; the
+        columns are built by repeating short arrays instead of row by row.
+        """
+        table = cls(time_slots, departments)
+        n_slots = len(time_slots)
+        n_depts = len(departments)
+        per_day = n_slots * n_depts
+        
+        for day in days:
+            table.day.extend(array('b', [day]) * per_day)
+        day_slots = array('h')
+        for slot_idx in range(n_slots):
+            day_slots.extend(array('h', [slot_idx]) * n_depts)
+        table.slot_idx = day_slots * len(days)
+        table.dept_idx = array('h', range(n_depts)) * (n_slots * len(days))
+        
+        n_rows = len(table.day)
+        table.employee = [None] * n_rows
+        table.assigned = bytearray(n_rows)
+        return table
+
+
 class Shift:
-    """Represents a shift assignment."""
+    """Represents a shift assignment.
+    
+    A Shift is a view of one row of a _ShiftTable; shifts generated by a
+    ShiftBuilder all share the builder's table.
+    """
+    
+    __slots__ = ('_table', '_row')
     
     def __init__(self, day: int, time_slot: str, department: str, employee: Employee = None):
-        self.day = day
-        self.time_slot = time_slot
-        self.department = department
-        self.employee = employee
+        if not 0 <= day < 7:
+            raise ValueError(f"Day must be between 0 and 6, got {day}")
+        self._table = _ShiftTable([time_slot], [department])
+        self._table.append(day, 0, 0, employee)
+        self._table.private = True
+        self._row = 0
+    
+    @classmethod
+    def _view(cls, table: _ShiftTable, row: int) -> 'Shift':
+        """Create a Shift backed by an existing table row."""
+        shift = cls.__new__(cls)
+        shift._table = table
+        shift._row = row
+        return shift
+    
+    @property
+    def day(self) -> int:
+        return self._table.day[self._row]
+    
+    @day.setter
+    def day(self, day: int):
+        if not 0 <= day < 7:
+            raise ValueError(f"Day must be between 0 and 6, got {day}")
+        self._table.day[self._row] = day
+    
+    @property
+    def time_slot(self) -> str:
+        return self._table.time_slots[self._table.slot_idx[self._row]]
+    
+    @time_slot.setter
+    def time_slot(self, time_slot: str):
+        self._table.slot_idx[self._row] = self._table.slot_index(time_slot)
+    
+    @property
+    def department(self) -> str:
+        return self._table.departments[self._table.dept_idx[self._row]]
+    
+    @department.setter
+    def department(self, department: str):
+        self._table.dept_idx[self._row] = self._table.dept_index(department)
+    
+    @property
+    def employee(self) -> Optional[Employee]:
+        return self._table.employee[self._row]
+    
+    @employee.setter
+    def employee(self, employee: Optional[Employee]):
+        self._table.employee[self._row] = employee
+        self._table.assigned[self._row] = employee is not None
     
     def assign_employee(self, employee: Employee) -> bool:
         """Assign an employee to this shift if they are eligible."""
@@ -64,9 +302,13 @@ class Shift:
             return True
         return False
     
+    def _assign_unchecked(self, employee: Employee):
+        """Assign an employee already known to be eligible for this shift."""
+        self.employee = employee
+    
     def is_assigned(self) -> bool:
         """Check if shift has an assigned employee."""
-        return self.employee is not None
+        return bool(self._table.assigned[self._row])
     
     def to_dict(self) -> dict:
         """Convert shift to dictionary format."""
@@ -85,7 +327,8 @@ class ShiftBuilder:
     
     def __init__(self):
         self.employees: List[Employee] = []
-        self.shifts: List[Shift] = []
+        self._table = _ShiftTable([], [])
+        self._shifts: Tuple[Shift, ...] = ()
         self.departments: Set[str] = set()
         self.time_slots: List[str] = []
     
@@ -98,129 +341,422 @@ class ShiftBuilder:
         """Set the time slots for shifts (e.g., ['Morning', 'Afternoon', 'Evening'])."""
         self.time_slots = time_slots
     
+    @property
+    def shifts(self) -> Tuple[Shift, ...]:
+        """Shifts created by the last call to generate_shifts.
+        
+        To add or remove shifts, assign a new sequence of Shift objects.
+        """
+        return self._shifts
+    
+    @shifts.setter
+    def shifts(self, shifts: List[Shift]):
+        shifts = tuple(shifts)
+        if shifts:
+            table = shifts[0]._table
+            if len(table) == len(shifts) and all(
+                    shift._table is table and shift._row == row
+                    for row, shift in enumerate(shifts)):
+                # Already the full table of one schedule, e.g. builder.shifts
+                self._table = table
+                self._shifts = shifts
+                return
+        
+        # Copy the shifts into a new table. Shifts created on their own are
+        # rebound to it, so changes through them and the builder stay in step;
+        # shifts that belong to another schedule (or repeat) get a new view.
+        # Configured time slots come first so the schedule prints in their order.
+        table = _ShiftTable(list(self.time_slots), [])
+        views = []
+        for row, shift in enumerate(shifts):
+            table.append(shift.day, table.slot_index(shift.time_slot),
+                         table.dept_index(shift.department), shift.employee)
+            if shift._table.private:
+                shift._table = table
+                shift._row = row
+            else:
+                shift = Shift._view(table, row)
+            views.append(shift)
+        self._table = table
+        self._shifts = tuple(views)
+    
     def generate_shifts(self, departments: List[str], days: List[int] = None):
         """Generate shifts for specified departments and days."""
         if days is None:
             days = list(range(7))  # All days of the week
         
+        for day in days:
+            if not 0 <= day < 7:
+                raise ValueError(f"Day must be between 0 and 6, got {day}")
+        
         self.departments.update(departments)
-        self.shifts = []
+        table = _ShiftTable.product(days, list(self.time_slots), list(departments))
+        self._table = table
+        self._shifts = tuple(Shift._view(table, row) for row in range(len(table)))
+    
+    def assign_shifts(self, max_shifts_per_day: Optional[int] = None):
+        """Assign employees to shifts based on availability and capabilities.
         
-        for day in days:
-            for time_slot in self.time_slots:
-                for department in departments:
-                    shift = Shift(day, time_slot, department)
-                    self.shifts.append(shift)
-    
-    def assign_shifts(self):
-        """Assign employees to shifts based on availability and capabilities."""
-        # Track employee assignments per day to balance workload
-        employee_shifts_per_day: Dict[str, Dict[int, int]] = {
-            emp.employee_id: {day: 0 for day in range(7)} for emp in self.employees
-        }
+        If max_shifts_per_day is given, no employee is assigned more than that
+        many shifts on a single day, and the greedy assignment is completed to
+        a maximum matching so that the limit leaves as few shifts open as possible.
+        """
+        table = self._table
+        employees = self.employees
+        
+        # Masks of the availability bits and departments this schedule uses, in
+        # the same layout as Employee.avail_mask and Employee.dept_mask
+        used_avail = 0
+        for day in set(table.day):
+            for slot_id in table.slot_ids:
+                used_avail |= 1 << (slot_id * 7 + day)
+        used_depts = 0
+        for dept_id in table.dept_ids:
+            used_depts |= 1 << dept_id
+        
+        # Eligibility matrix stored as bitsets over employee positions: one row
+        # per availability bit and one per department. Each employee's masks are
+        # ANDed with the used masks first, so unused bits are never visited.
+        avail_rows = [0] * used_avail.bit_length()
+        dept_rows = [0] * used_depts.bit_length()
+        for i, emp in enumerate(employees):
+            emp_bit = 1 << i
+            for bit in _iter_bits(emp.avail_mask & used_avail):
+                avail_rows[bit] |= emp_bit
+            for dept_id in _iter_bits(emp.dept_mask & used_depts):
+                dept_rows[dept_id] |= emp_bit
         
-        # Pre-compute eligible employees for each shift to optimize sorting
-        shift_eligible_map: Dict[Shift, List[Employee]] = {}
-        for shift in self.shifts:
-            eligible = []
-            for emp in self.employees:
-                if emp.is_available(shift.day, shift.time_slot) and \
-                   emp.can_work_in_department(shift.department):
-                    eligible.append(emp)
-            shift_eligible_map[shift] = eligible
+        # A shift's eligible employees are the AND of its availability and
+        # department rows
+        slot_ids = table.slot_ids
+        dept_sets = [dept_rows[dept_id] for dept_id in table.dept_ids]
+        eligible = [
+            avail_rows[slot_ids[slot_idx] * 7 + day] & dept_sets[dept_idx]
+            for day, slot_idx, dept_idx in zip(table.day, table.slot_idx, table.dept_idx)
+        ]
+        counts = [bin(employee_bits).count('1') for employee_bits in eligible]
+        
+        # Shifts nobody is eligible for stay unassigned and are left out here
+        open_rows = [
+            row for row, assigned in enumerate(table.assigned)
+            if not assigned and counts[row]
+        ]
         
         # Sort shifts to prioritize harder-to-fill shifts (fewer eligible employees)
-        sorted_shifts = sorted(self.shifts, key=lambda s: len(shift_eligible_map[s]))
+        sorted_rows = sorted(open_rows, key=counts.__getitem__)
         
-        for shift in sorted_shifts:
-            if shift.is_assigned():
-                continue
+        # Under a daily limit, shifts assigned before this call count toward
+        # each employee's load, indexed by employee position * 7 + day. Without
+        # one, balancing only counts the shifts assigned by this call.
+        fixed_loads = [0] * (7 * len(employees))
+        if max_shifts_per_day is not None:
+            position = {id(emp): i for i, emp in enumerate(employees)}
+            for row in compress(range(len(table)), table.assigned):
+                i = position.get(id(table.employee[row]))
+                if i is not None:
+                    fixed_loads[i * 7 + table.day[row]] += 1
+        
+        # Employee index chosen for each row, or -1
+        kernels = None
+        if len(employees) * len(sorted_rows) >= _KERNEL_MIN_CELLS:
+            kernels = _load_kernels()
+        if kernels is not None:
+            assigned_to = kernels.assign_from_bitsets(
+                eligible, table.day, sorted_rows, fixed_loads, max_shifts_per_day
+            )
+            for row in sorted_rows:
+                if assigned_to[row] != -1:
+                    self._shifts[row]._assign_unchecked(employees[assigned_to[row]])
+        else:
+            assigned_to = [-1] * len(table)
             
-            # Get pre-computed eligible employees
-            eligible_employees = shift_eligible_map[shift]
+            # Track employee assignments per day to balance workload
+            loads = list(fixed_loads)
             
-            if not eligible_employees:
-                continue
-            
-            # Select employee with fewest shifts on this day to balance workload
-            selected_employee = min(
-                eligible_employees,
-                key=lambda e: employee_shifts_per_day[e.employee_id][shift.day]
+            for row in sorted_rows:
+                day = table.day[row]
+                
+                # Get pre-computed eligible employees
+                candidates = list(_iter_bits(eligible[row]))
+                if max_shifts_per_day is not None:
+                    candidates = [
+                        i for i in candidates
+                        if loads[i * 7 + day] < max_shifts_per_day
+                    ]
+                    if not candidates:
+                        continue
+                
+                # Select employee with fewest shifts on this day to balance workload
+                selected = min(candidates, key=lambda i: loads[i * 7 + day])
+                
+                self._shifts[row]._assign_unchecked(employees[selected])
+                loads[selected * 7 + day] += 1
+                assigned_to[row] = selected
+        
+        # Without a daily limit every shift with an eligible employee is filled
+        # above; with one, the greedy choice can block shifts that a different
+        # assignment would have covered
+        if max_shifts_per_day is not None:
+            self._complete_matching(
+                open_rows, eligible, assigned_to, fixed_loads, max_shifts_per_day
             )
+    
+    def _complete_matching(self, open_rows: List[int], eligible: List[int],
+                           assigned_to: List[int], fixed_loads: List[int],
+                           max_shifts_per_day: int):
+        """Extend the current assignment of open_rows to a maximum matching.
+        
+        Each employee is split into max_shifts_per_day copies per day, which turns
+        the daily limit into a one-to-one matching between shifts and copies.
+        Copies already taken by shifts outside open_rows (fixed_loads) are left out.
+        """
+        table = self._table
+        copies_per_employee = 7 * max_shifts_per_day
+        
+        adjacency: List[List[int]] = []
+        match_left: List[int] = []
+        match_right = [-1] * (len(self.employees) * copies_per_employee)
+        copies_used = list(fixed_loads)
+        
+        for i, row in enumerate(open_rows):
+            day = table.day[row]
+            first_copy = day * max_shifts_per_day
+            adjacency.append([
+                emp_idx * copies_per_employee + first_copy + k
+                for emp_idx in _iter_bits(eligible[row])
+                for k in range(fixed_loads[emp_idx * 7 + day], max_shifts_per_day)
+            ])
             
-            shift.assign_employee(selected_employee)
-            employee_shifts_per_day[selected_employee.employee_id][shift.day] += 1
+            # Seed the matching with the greedy assignment
+            if assigned_to[row] != -1:
+                emp_idx = assigned_to[row]
+                node = emp_idx * copies_per_employee + first_copy + copies_used[emp_idx * 7 + day]
+                copies_used[emp_idx * 7 + day] += 1
+                match_left.append(node)
+                match_right[node] = i
+            else:
+                match_left.append(-1)
+        
+        _hopcroft_karp(adjacency, match_left, match_right)
+        
+        for row, node in zip(open_rows, match_left):
+            if node != -1:
+                self._shifts[row]._assign_unchecked(self.employees[node // copies_per_employee])
     
     def get_schedule(self) -> Dict[int, List[Shift]]:
         """Get the schedule organized by day."""
         schedule = {day: [] for day in range(7)}
-        for shift in self.shifts:
-            schedule[shift.day].append(shift)
+        for shift, day in zip(self._shifts, self._table.day):
+            schedule[day].append(shift)
         return schedule
     
+    def assigned_mask(self) -> bytes:
+        """Get one byte per shift: 1 if the shift is assigned, 0 otherwise."""
+        return bytes(self._table.assigned)
+    
     def get_unassigned_shifts(self) -> List[Shift]:
         """Get list of shifts that couldn't be assigned."""
-        return [shift for shift in self.shifts if not shift.is_assigned()]
+        unassigned = self._table.assigned.translate(_INVERT_FLAGS)
+        return list(compress(self._shifts, unassigned))
     
     def print_schedule(self):
         """Print the weekly schedule in a readable format."""
-        schedule = self.get_schedule()
+        table = self._table
+        
+        # Alphabetical rank of each department, so rows sort on integers
+        n_depts = len(table.departments)
+        dept_rank = [0] * n_depts
+        by_name = sorted(range(n_depts), key=lambda d: table.departments[d])
+        for rank, dept_idx in enumerate(by_name):
+            dept_rank[dept_idx] = rank
+        
+        # Position of each table time slot in self.time_slots. Shifts in other
+        # time slots go to a trailing group that is not printed.
+        time_slots = list(self.time_slots)
+        n_slots = len(time_slots)
+        slot_pos = [
+            time_slots.index(time_slot) if time_slot in time_slots else n_slots
+            for time_slot in table.time_slots
+        ]
         
-        print("\n" + "="*80)
-        print("WEEKLY SHIFT SCHEDULE")
-        print("="*80 + "\n")
+        # Order all rows by (day, time slot, department) in a single sort
+        order = sorted(
+            range(len(table)),
+            key=lambda r: (table.day[r] * (n_slots + 1) + slot_pos[table.slot_idx[r]])
+                          * n_depts + dept_rank[table.dept_idx[r]]
+        )
         
+        # Collect all lines and write them at once rather than per print call
+        out: List[str] = []
+        w = out.append
+        
+        w("\n" + "="*80)
+        w("WEEKLY SHIFT SCHEDULE")
+        w("="*80 + "\n")
+        
+        format_day = _day_formatter(tuple(self.DAYS), tuple(time_slots))
+        
+        pos = 0
         for day_num in range(7):
-            day_name = self.DAYS[day_num]
-            print(f"\n{day_name.upper()}")
-            print("-" * 80)
-            
-            day_shifts = schedule[day_num]
-            if not day_shifts:
-                print("  No shifts scheduled")
-                continue
-            
-            # Group by time slot and department
-            for time_slot in self.time_slots:
-                time_shifts = [s for s in day_shifts if s.time_slot == time_slot]
-                if time_shifts:
-                    print(f"\n  {time_slot}:")
-                    for shift in sorted(time_shifts, key=lambda s: s.department):
-                        employee_name = shift.employee.name if shift.employee else "UNASSIGNED"
-                        print(f"    {shift.department}: {employee_name}")
+            # Collect this day's shift lines per time slot, already in order
+            groups: List[List[str]] = [[] for _ in range(n_slots + 1)]
+            while pos < len(order) and table.day[order[pos]] == day_num:
+                row = order[pos]
+                pos += 1
+                employee = table.employee[row]
+                employee_name = employee.name if employee else "UNASSIGNED"
+                groups[slot_pos[table.slot_idx[row]]].append(
+                    f"    {table.departments[table.dept_idx[row]]}: {employee_name}"
+                )
+            out.extend(format_day(day_num, groups))
         
         # Show unassigned shifts if any
         unassigned = self.get_unassigned_shifts()
         if unassigned:
-            print("\n" + "="*80)
-            print("UNASSIGNED SHIFTS")
-            print("="*80)
+            w("\n" + "="*80)
+            w("UNASSIGNED SHIFTS")
+            w("="*80)
             for shift in unassigned:
-                print(f"  {self.DAYS[shift.day]} - {shift.time_slot} - {shift.department}")
+                w(f"  {self.DAYS[shift.day]} - {shift.time_slot} - {shift.department}")
         
-        print("\n" + "="*80 + "\n")
+        w("\n" + "="*80 + "\n")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def export_to_json(self, filename: str):
         """Export the schedule to a JSON file."""
+        table = self._table
         schedule_data = {
             'employees': [emp.to_dict() for emp in self.employees],
-            'shifts': [shift.to_dict() for shift in self.shifts],
-            'unassigned_count': len(self.get_unassigned_shifts())
+            'shifts': [
+                {
+                    'day': day,
+                    'time_slot': table.time_slots[slot_idx],
+                    'department': table.departments[dept_idx],
+                    'employee': employee.name if employee else 'UNASSIGNED'
+                }
+                for day, slot_idx, dept_idx, employee in zip(
+                    table.day, table.slot_idx, table.dept_idx, table.employee
+                )
+            ],
+            'unassigned_count': table.assigned.count(0)
         }
         
-        with open(filename, 'w') as f:
-            json.dump(schedule_data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(schedule_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(schedule_data, f, indent=2)
         
         print(f"Schedule exported to {filename}")
 
 
+@lru_cache(maxsize=32)
+def _day_formatter(days: Tuple[str, ...], time_slots: Tuple[str, ...]):
+    """Compile a function formatting one day of the printed schedule.
+    
+    The generated format_day(day_num, groups) takes one list of shift lines per
+    time slot and returns the day's output lines. Day headers and time slot
+    headings are baked into its source as constants.
+    """
+    headers = tuple(f"\n{day.upper()}" for day in days)
+    rule = "-" * 80
+    src = [
+        "def format_day(day_num, groups):",
+        f"    header = {headers!r}[day_num]",
+        "    if not any(groups):",
+        f"        return [header, {rule!r}, '  No shifts scheduled']",
+        f"    out = [header, {rule!r}]",
+    ]
+    for slot_idx, time_slot in enumerate(time_slots):
+        heading = f"\n  {time_slot}:"
+        src.append(f"    if groups[{slot_idx}]:")
+        src.append(f"        out.append({heading!r})")
+        src.append(f"        out.extend(groups[{slot_idx}])")
+    src.append("    return out")
+    
+    namespace: Dict[str, object] = {}
+    exec(compile("\n".join(src), "<format_day>", "exec"), namespace)
+    return namespace["format_day"]
+
+
+def _hopcroft_karp(adjacency: List[List[int]], match_left: List[int], match_right: List[int]):
+    """Grow a bipartite matching in place until it is maximum (Hopcroft-Karp).
+    
+    adjacency[u] lists the right nodes reachable from left node u; match_left and
+    match_right hold the current partner of each node, or -1 if it is unmatched.
+    """
+    while True:
+        # Layer the left nodes by alternating-path distance from the free ones
+        dist = [-1] * len(adjacency)
+        queue = [u for u, v in enumerate(match_left) if v == -1]
+        for u in queue:
+            dist[u] = 0
+        found_free = False
+        for u in queue:
+            for v in adjacency[u]:
+                w = match_right[v]
+                if w == -1:
+                    found_free = True
+                elif dist[w] == -1:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        if not found_free:
+            return
+        
+        # Augment along shortest paths with an iterative depth-first search
+        next_edge = [0] * len(adjacency)
+        for root, v in enumerate(match_left):
+            if v != -1:
+                continue
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                if next_edge[u] == len(adjacency[u]):
+                    dist[u] = -1  # dead end for the rest of this phase
+                    stack.pop()
+                    continue
+                v = adjacency[u][next_edge[u]]
+                next_edge[u] += 1
+                w = match_right[v]
+                if w == -1:
+                    for u in stack:
+                        v = adjacency[u][next_edge[u] - 1]
+                        match_left[u] = v
+                        match_right[v] = u
+                    break
+                if dist[w] == dist[u] + 1:
+                    stack.append(w)
+
+
+def _load_kernels():
+    """Import the compiled kernels on first use; None if numba is unavailable."""
+    global _kernels
+    if _kernels is None:
+        try:
+            import _shift_kernels
+        except ImportError:
+            _kernels = False
+        else:
+            _kernels = _shift_kernels
+    return _kernels or None
+
+
+def _iter_employee_records(filename: str) -> Iterator[dict]:
+    """Yield the raw employee records of a JSON input file."""
+    if ijson is not None and os.path.getsize(filename) >= _STREAMING_THRESHOLD:
+        with open(filename, 'rb') as f:
+            yield from ijson.items(f, 'employees.item')
+    else:
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        yield from data.get('employees', [])
+
+
 def load_employees_from_json(filename: str) -> List[Employee]:
     """Load employee data from a JSON file."""
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    
     employees = []
-    for emp_data in data.get('employees', []):
+    for emp_data in _iter_employee_records(filename):
         emp = Employee(emp_data['name'], emp_data['employee_id'])
         
         for dept in emp_data.get('departments', []):
@@ -229,13 +765,22 @@ def load_employees_from_json(filename: str) -> List[Employee]:
         for day_str, time_slots in emp_data.get('availability', {}).items():
             day = int(day_str)
             for time_slot in time_slots:
-                emp.add_availability(day, time_slot)
+                emp.set_availability(day, _slots.intern(time_slot))
         
         employees.append(emp)
     
     return employees
 
 
+def load_employees_from_files(filenames: List[str]) -> List[Employee]:
+    """Load employee data from several JSON files, concatenated in file order."""
+    if not filenames:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+        results = list(executor.map(load_employees_from_json, filenames))
+    return list(chain.from_iterable(results))
+
+
 if __name__ == "__main__":
     # Example usage
     print("Shift Builder - Example Usage\n")